@@ -56,16 +56,17 @@ def get_cumulative_dict_attribute(obj, attr_name):
     hierarchy are recorded
 
     Args:
-    obj -- obj from which to determine class hierarchy
+    obj -- obj (or class) from which to determine class hierarchy
     attr_name -- class attribute name to cumulate (string). The class attribute
         thus designated should be a dictionary
 
     Returns:
     {<key>: [(<class>, <value>)]}
     """
+    klass = obj if isinstance(obj, type) else obj.__class__
     properties = [
         (getattr(cls, attr_name), cls)
-        for cls in obj.__class__.__mro__
+        for cls in klass.__mro__
         if attr_name in vars(cls)
     ]
     res = {key: [] for prop, _ in properties for key in prop}  # Initialize res
@@ -243,23 +244,46 @@ class FeatureBase(FeatureBaseInterface):
         self.__module__ = self.NAMESPACE
         fpo.Proxy = self
 
-        properties = get_cumulative_dict_attribute(self, "PROPERTIES")
-        for name in properties.keys() - set(fpo.PropertiesList):
-            self._set_property(name, properties)
+        specs, prop_keys, prop_order = self._properties_schema()
+        existing = fpo.PropertiesList
+        if not prop_keys.issubset(existing):
+            # Some properties are missing (creation or legacy document)
+            missing = prop_keys.difference(existing)
+            for name in prop_order:
+                if name in missing:
+                    self._set_property(name, specs)
         self.on_set_properties_cb(fpo)
 
-    def _set_property(self, name, properties=None):
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _properties_schema(cls):
+        """Get resolved property specifications of the class.
+
+        Specifications are collected from PROPERTIES attributes in class
+        hierarchy: for each property, the most derived class prevails.
+
+        Returns:
+            The property specifications (dict name: Prop), the property names
+            (frozenset) and the property names in insertion order (tuple)
+        """
+        properties = get_cumulative_dict_attribute(cls, "PROPERTIES")
+        specs = {
+            name: Prop._make(values[0][1])
+            for name, values in properties.items()
+        }
+        return specs, frozenset(specs), tuple(specs)
+
+    def _set_property(self, name, specs=None):
         """Set one property for underlying FeaturePython.
 
         fpo is assumed to have already been set.
-        if no 'properties' parameter is provided, properties are computed
-        from object's PROPERTIES attributes.
+        if no 'specs' parameter is provided, property specifications are
+        computed from object's PROPERTIES attributes.
         """
-        if not properties:
-            properties = get_cumulative_dict_attribute(self, "PROPERTIES")
+        if not specs:
+            specs, _, _ = self._properties_schema()
 
-        _, specdata = properties[name][0]
-        spec = Prop._make(specdata)
+        spec = specs[name]
         prop = self.fpo.addProperty(spec.Type, name, spec.Group, spec.Doc, 0)
         setattr(prop, name, spec.Default)
         self.fpo.setEditorMode(name, spec.EditorMode)
@@ -483,10 +507,16 @@ class ViewProviderBase(ViewProviderBaseInterface):
 
     def getIcon(self):
         """Return the icon which will appear in the tree view (callback)."""
+        return self._icon_path()
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _icon_path(cls):
+        """Get icon path, resolved from ICON."""
         icon = (
-            self.ICON
-            if self.ICON.startswith(":")
-            else os.path.join(ICONDIR, self.ICON)
+            cls.ICON
+            if cls.ICON.startswith(":")
+            else os.path.join(ICONDIR, cls.ICON)
         )
         return icon
 
@@ -28,12 +28,11 @@ later for rendering.
 
 from math import degrees, radians
 from types import SimpleNamespace
-import shlex
+import functools
+import re
 
-from pivy import coin
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD as App
-import FreeCADGui as Gui
 
 from Render.base import (
     FeatureBase,
@@ -58,6 +57,37 @@ VIEWPORTMAPPINGENUM = (
     "LEAVE_ALONE",
 )
 
+# Templates to write Coin camera strings, by projection
+_COIN_STRING_HEAD = (
+    "#Inventor V2.1 ascii\n\n\n\n"
+    "{projection}Camera {{\n"
+    " viewportMapping {mapping}\n"
+    " position {base[0]} {base[1]} {base[2]}\n"
+    " orientation {axis[0]} {axis[1]} {axis[2]} {angle}\n"
+    " nearDistance {near}\n"
+    " farDistance {far}\n"
+    " aspectRatio {ratio}\n"
+    " focalDistance {focal}\n"
+)
+_COIN_STRING_TEMPLATES = {
+    "Perspective": _COIN_STRING_HEAD + " heightAngle {height}\n}}\n",
+    "Orthographic": _COIN_STRING_HEAD + " height {height}\n}}\n",
+}
+
+# Cache of Coin constants for ViewportMapping values (name: value), populated
+# on first use to avoid repeated attribute lookups on Coin nodes
+_VIEWPORT_ATTR_CACHE = {}
+
+# Tokenizer for Coin camera strings: a field name is the first word of a line,
+# followed by its values (numbers or enum words); comments are skipped
+_CAM_TOKEN_RE = re.compile(
+    r"#[^\n]*"
+    r"|^[ \t]*(?P<key>[A-Za-z_]\w*)"
+    r"|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w.])"
+    r"|(?P<word>[A-Za-z_]\w*)",
+    re.MULTILINE,
+)
+
 
 # ===========================================================================
 
@@ -142,7 +172,14 @@ class Camera(PointableFeatureMixin, FeatureBase):
         if App.GuiUp:
             viewp.set_camera_from_gui()
         else:
-            set_cam_from_coin_string(fpo, DEFAULT_CAMERA_STRING)
+            _apply_default_cam(fpo)
+
+
+# Allowed values for Camera enumeration properties
+_VALID_ENUMS = {
+    field: frozenset(Camera.PROPERTIES[field].Default)
+    for field in ("Projection", "ViewportMapping")
+}
 
 
 # ===========================================================================
@@ -189,32 +226,33 @@ class ViewProviderCamera(
     def set_camera_from_gui(self):
         """Set this camera from GUI camera."""
         assert App.GuiUp, "Cannot set camera from GUI: GUI is down"
+        import FreeCADGui as Gui  # pylint: disable=import-outside-toplevel
+
         fpo = self.fpo
         node = Gui.ActiveDocument.ActiveView.getCameraNode()
-        typ = node.getTypeId()
-        if typ == coin.SoPerspectiveCamera.getClassTypeId():
-            fpo.Projection = "Perspective"
-            fpo.HeightAngle = degrees(float(node.heightAngle.getValue()))
-        elif typ == coin.SoOrthographicCamera.getClassTypeId():
-            fpo.Projection = "Orthographic"
-            fpo.Height = float(node.height.getValue())
-        else:
+        handler = _get_camera_type_handlers().get(node.getTypeId().getKey())
+        if handler is None:
             raise ValueError("Unknown camera type")
+        handler(fpo, node)
 
         pos = App.Vector(node.position.getValue())
         rot = App.Rotation(*node.orientation.getValue().getValue())
         fpo.Placement = App.Placement(pos, rot)
 
-        fpo.NearDistance = float(node.nearDistance.getValue())
-        fpo.FarDistance = float(node.farDistance.getValue())
-        fpo.FocalDistance = float(node.focalDistance.getValue())
-        fpo.AspectRatio = float(node.aspectRatio.getValue())
+        # Coin fields return Python floats: no conversion needed
+        fpo.NearDistance = node.nearDistance.getValue()
+        fpo.FarDistance = node.farDistance.getValue()
+        fpo.FocalDistance = node.focalDistance.getValue()
+        fpo.AspectRatio = node.aspectRatio.getValue()
         index = node.viewportMapping.getValue()
         fpo.ViewportMapping = VIEWPORTMAPPINGENUM[index]
 
     def set_gui_from_camera(self):
         """Set GUI camera to this camera."""
         assert App.GuiUp, "Cannot set GUI from camera: GUI is down"
+        # pylint: disable=import-outside-toplevel
+        import FreeCADGui as Gui
+        from pivy import coin
 
         fpo = self.fpo
 
@@ -223,15 +261,19 @@ class ViewProviderCamera(
         node = Gui.ActiveDocument.ActiveView.getCameraNode()
 
         node.position.setValue(fpo.Placement.Base)
-        rot = fpo.Placement.Rotation
-        axis = coin.SbVec3f(rot.Axis.x, rot.Axis.y, rot.Axis.z)
-        node.orientation.setValue(axis, rot.Angle)
+        # Both FreeCAD and Coin quaternions are ordered (x, y, z, w)
+        node.orientation.setValue(coin.SbRotation(*fpo.Placement.Rotation.Q))
 
+        # Distances are quantities and must be converted, whereas AspectRatio
+        # is already a float
         node.nearDistance.setValue(float(fpo.NearDistance))
         node.farDistance.setValue(float(fpo.FarDistance))
         node.focalDistance.setValue(float(fpo.FocalDistance))
-        node.aspectRatio.setValue(float(fpo.AspectRatio))
-        node.viewportMapping.setValue(getattr(node, fpo.ViewportMapping))
+        node.aspectRatio.setValue(fpo.AspectRatio)
+        mapping = fpo.ViewportMapping
+        if mapping not in _VIEWPORT_ATTR_CACHE:
+            _VIEWPORT_ATTR_CACHE[mapping] = getattr(node, mapping)
+        node.viewportMapping.setValue(_VIEWPORT_ATTR_CACHE[mapping])
 
         if fpo.Projection == "Orthographic":
             node.height.setValue(float(fpo.Height))
@@ -242,6 +284,80 @@ class ViewProviderCamera(
 # ===========================================================================
 
 
+def _apply_persp(fpo, node):
+    """Set projection-specific data of a Camera from a perspective node."""
+    fpo.Projection = "Perspective"
+    fpo.HeightAngle = degrees(node.heightAngle.getValue())
+
+
+def _apply_ortho(fpo, node):
+    """Set projection-specific data of a Camera from an orthographic node."""
+    fpo.Projection = "Orthographic"
+    fpo.Height = node.height.getValue()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_camera_type_handlers():
+    """Get handlers to set a Camera from a Coin camera node, by node type.
+
+    Handlers are mapped on first call and cached afterwards. Mapping is keyed
+    by Coin type keys (int), as SoType wrappers are not reliably hashable.
+
+    Returns:
+        A dictionary {<Coin type key>: <handler(fpo, node)>}
+    """
+    from pivy import coin  # pylint: disable=import-outside-toplevel
+
+    return {
+        coin.SoPerspectiveCamera.getClassTypeId().getKey(): _apply_persp,
+        coin.SoOrthographicCamera.getClassTypeId().getKey(): _apply_ortho,
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_coin_string(camstr):
+    """Parse a Coin camera string.
+
+    Results are cached, as the same strings tend to be parsed repeatedly
+    (default camera, legacy cameras...): the returned dictionary must not be
+    modified.
+
+    Args:
+        camstr -- The Coin-formatted camera string (see
+            set_cam_from_coin_string)
+
+    Returns:
+        The camera type ("Perspective" or "Orthographic") and a dictionary
+        {field: values}
+    """
+    # Split header (file header and camera type) and camera node body
+    if not camstr.startswith("#Inventor"):
+        raise ValueError("Invalid camera string: missing Inventor header")
+    head, brace, body = camstr.partition("{")
+    if not brace:
+        raise ValueError("Invalid camera string: missing camera node")
+    body = body.rsplit("}", 1)[0]
+    projection = head.split()[-1][0:-6]  # Last word before node: cam type
+    if projection not in _VALID_ENUMS["Projection"]:
+        raise ValueError("Invalid camera header in camera string")
+
+    # Tokenize body into a dictionary field: values
+    camdict = {}
+    values = None
+    for match in _CAM_TOKEN_RE.finditer(body):
+        kind = match.lastgroup
+        if kind == "key":
+            values = camdict[match["key"]] = []
+        elif kind is None or values is None:
+            continue  # Comment, or value without field
+        elif kind == "number":
+            values.append(float(match["number"]))
+        else:
+            values.append(match["word"])
+
+    return projection, camdict
+
+
 def set_cam_from_coin_string(cam, camstr):
     """Set a Camera object from a Coin camera string.
 
@@ -281,34 +397,25 @@ def set_cam_from_coin_string(cam, camstr):
 
     }
     """
-    # Split, clean and tokenize
-    camdata = [
-        y
-        for y in [shlex.split(x, comments=True) for x in camstr.split("\n")]
-        if y
-    ]
-    camdict = {y[0]: y[1:] for y in camdata}
+    projection, camdict = _parse_coin_string(camstr)
 
-    cam.Projection = camdata[0][0][0:-6]  # Data should start with Cam Type...
-    assert cam.Projection in (
-        "Perspective",
-        "Orthographic",
-    ), "Invalid camera header in camera string"
+    cam.Projection = projection
+    # Nota: numeric values have already been converted to float by tokenizer
     try:
-        pos = App.Vector(camdict["position"][0:3])
-        rot = App.Rotation(
-            App.Vector(camdict["orientation"][0:3]),
-            degrees(float(camdict["orientation"][3])),
+        posx, posy, posz = camdict["position"][:3]
+        axisx, axisy, axisz, angle = camdict["orientation"][:4]
+        cam.Placement = App.Placement(
+            App.Vector(posx, posy, posz),
+            App.Rotation(App.Vector(axisx, axisy, axisz), degrees(angle)),
         )
-        cam.Placement = App.Placement(pos, rot)
-        cam.FocalDistance = float(camdict["focalDistance"][0])
+        cam.FocalDistance = camdict["focalDistance"][0]
     except KeyError as err:
         raise ValueError(f"Missing field in camera string: {err}") from err
 
     # It may happen that aspect ratio and viewport mapping are not set in
     # camstr...
     try:
-        cam.AspectRatio = float(camdict["aspectRatio"][0])
+        cam.AspectRatio = camdict["aspectRatio"][0]
     except KeyError:
         cam.AspectRatio = 1.0
     try:
@@ -318,18 +425,18 @@ def set_cam_from_coin_string(cam, camstr):
 
     # It may also happen that near & far distances are not set in camstr...
     try:
-        cam.NearDistance = float(camdict["nearDistance"][0])
+        cam.NearDistance = camdict["nearDistance"][0]
     except KeyError:
         pass
     try:
-        cam.FarDistance = float(camdict["farDistance"][0])
+        cam.FarDistance = camdict["farDistance"][0]
     except KeyError:
         pass
 
     if cam.Projection == "Orthographic":
-        cam.Height = float(camdict["height"][0])
+        cam.Height = camdict["height"][0]
     elif cam.Projection == "Perspective":
-        cam.HeightAngle = degrees(float(camdict["heightAngle"][0]))
+        cam.HeightAngle = degrees(camdict["heightAngle"][0])
 
 
 def get_cam_from_coin_string(camstr):
@@ -352,38 +459,33 @@ def get_coin_string_from_cam(cam):
 
     def check_enum(field):
         """Check whether the enum field value is valid."""
-        assert (
-            getattr(cam, field) in Camera.PROPERTIES[field].Default
-        ), f"Camera: Invalid {field} value"
+        if getattr(cam, field) not in _VALID_ENUMS[field]:
+            raise ValueError(f"Camera: Invalid {field} value")
 
     check_enum("Projection")
     check_enum("ViewportMapping")
 
-    base = cam.Placement.Base
-    rot = cam.Placement.Rotation
+    placement = cam.Placement
+    rot = placement.Rotation
+    projection = cam.Projection
 
-    if cam.Projection == "Orthographic":
-        height = f" height {float(cam.Height)}"
-    elif cam.Projection == "Perspective":
-        height = f" heightAngle {radians(cam.HeightAngle)}"
+    if projection == "Orthographic":
+        height = float(cam.Height)
     else:
-        height = ""
-
-    res = [
-        "#Inventor V2.1 ascii\n\n\n",
-        f"{cam.Projection}Camera {{",
-        f" viewportMapping {cam.ViewportMapping}",
-        f" position {base[0]} {base[1]} {base[2]}",
-        f" orientation {rot.Axis[0]} {rot.Axis[1]} {rot.Axis[2]} {rot.Angle}",
-        f" nearDistance {float(cam.NearDistance)}",
-        f" farDistance {float(cam.FarDistance)}",
-        f" aspectRatio {float(cam.AspectRatio)}",
-        f" focalDistance {float(cam.FocalDistance)}",
-        height,
-        "}}\n",
-    ]
-
-    return "\n".join(res)
+        height = radians(cam.HeightAngle)
+
+    return _COIN_STRING_TEMPLATES[projection].format(
+        projection=projection,
+        mapping=cam.ViewportMapping,
+        base=placement.Base,
+        axis=rot.Axis,
+        angle=rot.Angle,
+        near=float(cam.NearDistance),
+        far=float(cam.FarDistance),
+        ratio=float(cam.AspectRatio),
+        focal=float(cam.FocalDistance),
+        height=height,
+    )
 
 
 def retrieve_legacy_camera(project):
@@ -417,3 +519,19 @@ OrthographicCamera {
   height 100
 }
 """
+
+# ...and its values, parsed once for all
+_DEFAULT_CAM_VALUES = vars(get_cam_from_coin_string(DEFAULT_CAMERA_STRING))
+
+
+def _apply_default_cam(cam):
+    """Set a Camera object to default camera values.
+
+    This is equivalent to set_cam_from_coin_string(cam, DEFAULT_CAMERA_STRING),
+    without parsing.
+
+    Args:
+        cam -- The Camera to set (as a Camera FeaturePython object)
+    """
+    for key, value in _DEFAULT_CAM_VALUES.items():
+        setattr(cam, key, value)
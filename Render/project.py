@@ -450,13 +450,21 @@ class Project(FeatureBase):
 
         # Merge all strings (cam, objects, ground plane...) into rendering
         # template
+        # Nota: replacements are passed as functions, so that re.sub inserts
+        # them verbatim, without parsing them for escapes and group references
         renderobjs = "\n".join(objstrings)
         if "RaytracingCamera" in template:
-            template = re.sub("(.*RaytracingCamera.*)", cam, template)
-            template = re.sub("(.*RaytracingContent.*)", renderobjs, template)
+            template = re.sub(
+                "(.*RaytracingCamera.*)", lambda _: cam, template
+            )
+            template = re.sub(
+                "(.*RaytracingContent.*)", lambda _: renderobjs, template
+            )
         else:
             template = re.sub(
-                "(.*RaytracingContent.*)", cam + "\n" + renderobjs, template
+                "(.*RaytracingContent.*)",
+                lambda _: cam + "\n" + renderobjs,
+                template,
             )
         version_major = sys.version_info.major
         template = template.encode("utf8") if version_major < 3 else template
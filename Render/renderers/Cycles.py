@@ -49,49 +49,55 @@
 
 
 import pathlib
-from math import degrees, asin, sqrt, radians, atan2
+import itertools
+from math import asin, sqrt, atan2, pi
 from textwrap import indent
 
 import FreeCAD as App
 
 TEMPLATE_FILTER = "Cycles templates (cycles_*.xml)"
 
+# Angle conversion factors
+_RAD2DEG = 180.0 / pi
+_DEG2RAD = pi / 180.0
+
+# Basis vectors (not to be modified in place)
+_EX = App.Vector(1.0, 0.0, 0.0)
+_EY = App.Vector(0.0, 1.0, 0.0)
+
 # ===========================================================================
 #                             Write functions
 # ===========================================================================
 
 
-def write_mesh(name, mesh, material):
-    """Compute a string in renderer SDL to represent a FreeCAD mesh."""
-    snippet_mat = _write_material(name, material)
-
-    snippet_obj = """
+_MESH_SNIPPET = """
     <state shader="{n}">
         <mesh P="{p}"
               nverts="{i}"
               verts="{v}"/>
     </state>\n"""
 
-    snippet = snippet_mat + snippet_obj
 
-    points = [f"{p.x} {p.y} {p.z}" for p in mesh.Topology[0]]
-    verts = [f"{v[0]} {v[1]} {v[2]}" for v in mesh.Topology[1]]
-    nverts = ["3"] * len(verts)
+def write_mesh(name, mesh, material):
+    """Compute a string in renderer SDL to represent a FreeCAD mesh."""
+    snippet_mat = _write_material(name, material)
+
+    points, verts = mesh.Topology
+    nverts = ("3  " * len(verts))[:-2]  # All facets are triangles
 
-    return snippet.format(
-        n=name, p="  ".join(points), i="  ".join(nverts), v="  ".join(verts)
+    # Material snippet is already formatted: only format mesh snippet
+    return snippet_mat + _MESH_SNIPPET.format(
+        n=name,
+        p=_format_triplets(points),
+        i=nverts,
+        v=_format_triplets(verts),
     )
 
 
-def write_camera(name, pos, updir, target, fov):
-    """Compute a string in renderer SDL to represent a camera."""
-    # This is where you create a piece of text in the format of
-    # your renderer, that represents the camera.
-
-    # Cam rotation is angle(deg) axisx axisy axisz
-    # Scale needs to have z inverted to behave like a decent camera.
-    # No idea what they have been doing at blender :)
-    snippet = """
+# Cam rotation is angle(deg) axisx axisy axisz
+# Scale needs to have z inverted to behave like a decent camera.
+# No idea what they have been doing at blender :)
+_CAMERA_SNIPPET = """
     <!-- Generated by FreeCAD - Camera '{n}' -->
     <transform rotate="{a} {r.x} {r.y} {r.z}"
                translate="{p.x} {p.y} {p.z}"
@@ -100,21 +106,21 @@ def write_camera(name, pos, updir, target, fov):
                 fov="{f}"/>
     </transform>"""
 
-    return snippet.format(
+
+def write_camera(name, pos, updir, target, fov):
+    """Compute a string in renderer SDL to represent a camera."""
+    # This is where you create a piece of text in the format of
+    # your renderer, that represents the camera.
+    return _CAMERA_SNIPPET.format(
         n=name,
-        a=degrees(pos.Rotation.Angle),
+        a=pos.Rotation.Angle * _RAD2DEG,
         r=pos.Rotation.Axis,
         p=pos.Base,
-        f=radians(fov),
+        f=fov * _DEG2RAD,
     )
 
 
-def write_pointlight(name, pos, color, power):
-    """Compute a string in renderer SDL to represent a point light."""
-    # This is where you write the renderer-specific code
-    # to export a point light in the renderer format
-
-    snippet = """
+_POINTLIGHT_SNIPPET = """
     <!-- Generated by FreeCAD - Pointlight '{n}' -->
     <shader name="{n}_shader">
         <emission name="{n}_emit"
@@ -129,17 +135,16 @@ def write_pointlight(name, pos, color, power):
                strength="1 1 1"/>
     </state>\n"""
 
-    return snippet.format(n=name, c=color, p=pos, s=power * 100)
+
+def write_pointlight(name, pos, color, power):
+    """Compute a string in renderer SDL to represent a point light."""
+    # This is where you write the renderer-specific code
+    # to export a point light in the renderer format
+    return _POINTLIGHT_SNIPPET.format(n=name, c=color, p=pos, s=power * 100)
 
 
-def write_arealight(name, pos, size_u, size_v, color, power, transparent):
-    """Compute a string in renderer SDL to represent an area light."""
-    # Transparent area light
-    rot = pos.Rotation
-    axis1 = rot.multVec(App.Vector(1.0, 0.0, 0.0))
-    axis2 = rot.multVec(App.Vector(0.0, 1.0, 0.0))
-    direction = axis1.cross(axis2)
-    snippet1 = """
+# Transparent area light
+_AREALIGHT_SNIPPET_TRANSPARENT = """
     <!-- Generated by FreeCAD - Area light '{n}' (transparent) -->
     <shader name="{n}_shader">
         <emission name="{n}_emit"
@@ -162,18 +167,8 @@ def write_arealight(name, pos, size_u, size_v, color, power, transparent):
         />
     </state>\n"""
 
-    # Opaque area light (--> mesh light)
-    points = [
-        (-size_u / 2, -size_v / 2, 0),
-        (+size_u / 2, -size_v / 2, 0),
-        (+size_u / 2, +size_v / 2, 0),
-        (-size_u / 2, +size_v / 2, 0),
-    ]
-    points = [pos.multVec(App.Vector(*p)) for p in points]
-    points = [f"{p.x} {p.y} {p.z}" for p in points]
-    points = "  ".join(points)
-
-    snippet2 = """
+# Opaque area light (--> mesh light)
+_AREALIGHT_SNIPPET_OPAQUE = """
     <!-- Generated by FreeCAD - Area light '{n}' (opaque) -->
     <shader name="{n}_shader" use_mis="true">
         <emission name="{n}_emit"
@@ -190,34 +185,59 @@ def write_arealight(name, pos, size_u, size_v, color, power, transparent):
               />
     </state>\n"""
 
-    snippet = snippet1 if transparent else snippet2
-    strength = power if transparent else power / (size_u * size_v)
 
-    return snippet.format(
+def write_arealight(name, pos, size_u, size_v, color, power, transparent):
+    """Compute a string in renderer SDL to represent an area light."""
+    write = (
+        _write_arealight_transparent
+        if transparent
+        else _write_arealight_opaque
+    )
+    return write(name, pos, size_u, size_v, color, power)
+
+
+def _write_arealight_transparent(name, pos, size_u, size_v, color, power):
+    """Compute a string in renderer SDL for a transparent area light."""
+    rot = pos.Rotation
+    axis1 = rot.multVec(_EX)
+    axis2 = rot.multVec(_EY)
+    direction = axis1.cross(axis2)
+
+    return _AREALIGHT_SNIPPET_TRANSPARENT.format(
         n=name,
         c=color,
         p=pos.Base,
-        s=strength / 100,
+        s=power / 100,
         u=axis1,
         v=axis2,
         a=size_u,
         b=size_v,
         d=direction,
-        P=points,
     )
 
 
-def write_sunskylight(name, direction, distance, turbidity, albedo):
-    """Compute a string in renderer SDL to represent a sunsky light."""
-    # We use the new improved nishita model (2020)
+def _write_arealight_opaque(name, pos, size_u, size_v, color, power):
+    """Compute a string in renderer SDL for an opaque area light.
 
-    assert direction.Length
-    _dir = App.Vector(direction)
-    _dir.normalize()
-    theta = asin(_dir.z / sqrt(_dir.x ** 2 + _dir.y ** 2 + _dir.z ** 2))
-    phi = atan2(_dir.x, _dir.y)
+    Opaque area light is rendered as a mesh light.
+    """
+    points = [
+        (-size_u / 2, -size_v / 2, 0),
+        (+size_u / 2, -size_v / 2, 0),
+        (+size_u / 2, +size_v / 2, 0),
+        (-size_u / 2, +size_v / 2, 0),
+    ]
+    points = _format_triplets([pos.multVec(App.Vector(*p)) for p in points])
 
-    snippet = """
+    return _AREALIGHT_SNIPPET_OPAQUE.format(
+        n=name,
+        c=color,
+        s=power / (size_u * size_v) / 100,
+        P=points,
+    )
+
+
+_SUNSKYLIGHT_SNIPPET = """
     <!-- Generated by FreeCAD - Sun_sky light '{n}' -->
     <background name="{n}_bg">
           <background name="{n}_bg" strength="0.3"/>
@@ -233,15 +253,23 @@ def write_sunskylight(name, direction, distance, turbidity, albedo):
           <connect from="{n}_bg background" to="output surface" />
     </background>\n"""
 
-    return snippet.format(n=name, t=turbidity, g=albedo, e=theta, r=phi)
 
+def write_sunskylight(name, direction, distance, turbidity, albedo):
+    """Compute a string in renderer SDL to represent a sunsky light."""
+    # We use the new improved nishita model (2020)
+
+    assert direction.Length
+    _dir = App.Vector(direction)
+    _dir.normalize()
+    theta = asin(_dir.z / sqrt(_dir.x ** 2 + _dir.y ** 2 + _dir.z ** 2))
+    phi = atan2(_dir.x, _dir.y)
+
+    return _SUNSKYLIGHT_SNIPPET.format(
+        n=name, t=turbidity, g=albedo, e=theta, r=phi
+    )
 
-def write_imagelight(name, image):
-    """Compute a string in renderer SDL to represent an image-based light."""
-    # Caveat: Cycles requires the image file to be in the same directory
-    # as the input file
-    filename = pathlib.Path(image).name
-    snippet = """
+
+_IMAGELIGHT_SNIPPET = """
     <!-- Generated by FreeCAD - Image-based light '{n}' -->
     <background>
           <background name="{n}_bg" />
@@ -250,12 +278,30 @@ def write_imagelight(name, image):
           <connect from="{n}_tex color" to="{n}_bg color" />
           <connect from="{n}_bg background" to="output surface" />
     </background>\n"""
-    return snippet.format(
+
+
+def write_imagelight(name, image):
+    """Compute a string in renderer SDL to represent an image-based light."""
+    # Caveat: Cycles requires the image file to be in the same directory
+    # as the input file
+    filename = pathlib.Path(image).name
+    return _IMAGELIGHT_SNIPPET.format(
         n=name,
         f=filename,
     )
 
 
+def _format_triplets(triplets):
+    """Format a sequence of triplets (points, facets...) into a SDL string.
+
+    All the values are formatted in one single operation, with a format
+    string repeated for each triplet, rather than triplet by triplet.
+    Triplets are separated by 2 spaces, values by 1 space.
+    """
+    values = tuple(itertools.chain.from_iterable(triplets))
+    return ("%s %s %s  " * len(triplets))[:-2] % values
+
+
 # ===========================================================================
 #                              Material implementation
 # ===========================================================================
@@ -461,7 +507,7 @@ def render(project, prefix, external, output, width, height):
         prefix += " "
     rpath = params.GetString("CyclesPath", "")
     args = params.GetString("CyclesParameters", "")
-    args += " --output " + output
+    args += f' --output "{output}"'
     if not external:
         args += " --background"
     if not rpath: